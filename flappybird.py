@@ -1,6 +1,12 @@
 """A recreation of Flappy Bird for the NCEA 3.7 internal."""
-from tkinter import *  # importing tkinter
+from tkinter import Button, Canvas, Frame, Label, StringVar, Tk  # tkinter
+import cProfile  # importing cProfile
+import math  # importing math
+import pstats  # importing pstats
 import random  # importing random
+import sys  # importing sys
+import time  # importing time
+from collections import deque  # importing deque
 
 
 class Player:
@@ -11,43 +17,43 @@ class Player:
 
     Instance Variables
     ----------
-    _canvas : tk
-        canvas on which to draw objects on
+    _canvas_move : method
+        the canvas move method, bound once rather than looked up every frame
     _player_rectangle : tk
         player tk rectangle object
-    _control_key : str
-        key that controls the player
-    _control_button : int
-        number to represent which button click controls player
     _y_velocity : int
         players y axis speed
-    _movement_stack : list
-        stack to control player movement
+    _jump_requested : bool
+        whether the player has asked to flap since the last frame
+    _x0 : float
+        cached left x of the player rectangle
+    _y0 : float
+        cached top y of the player rectangle
+    _x1 : float
+        cached right x of the player rectangle
+    _y1 : float
+        cached bottom y of the player rectangle
 
     Methods
     ----------
-    __init__(self, canvas, x, y, control_key, control_button):
+    __init__(self, canvas, x, y):
         Establishes the attributes that are used by the class.
 
         :param canvas: specifies where the object is made.
         :param x: specifies the Birds starting x position in the game.
         :param y: specifies the Birds starting y position in the game.
-        :param control_key: specifies which button/s are used to control
-        the birds movement.
 
     move(self):
         Manage the movement of the bird.
 
     _fall(self):
-        Move the bird downwards in an increasing amount.
+        Speed the bird up downwards by an increasing amount.
 
     _flap(self):
-        Move the bird upwards with a natural increase.
-
-    event_checked(self, event):
-        Check event and triggers flap.
+        Set the birds velocity upwards.
 
-        :param event: contains information on what key was pressed
+    event_entered(self):
+        Make the bird flap on the next frame.
 
     get_coordinates(self):
         Return player position.
@@ -55,9 +61,15 @@ class Player:
         :return: player_position.
     """
 
+    # fixed attributes use less memory and are faster to access than an
+    # instance dictionary
+    __slots__ = ("_canvas_move", "player_rectangle", "_y_velocity",
+                 "_jump_requested", "_x0", "_y0", "_x1", "_y1")
+
     _BIRD_WIDTH = 40  # integer constant for the birds x size in pixels
     _BIRD_HEIGHT = 40  # integer constant for the birds y size in pixels
 
+    LEFT_X = 0  # index for bird_position left x
     TOP_Y = 1  # index for bird_position top y
     RIGHT_X = 2  # index for bird_position right x
     BOTTOM_Y = 3  # index for bird_position bottom y
@@ -65,90 +77,84 @@ class Player:
     _ACCELERATION = 5  # integer constant for acceleration
     _JUMP_TIME = 1.6  # integer constant for jump exponent
     _FALL_TIME = 0.1  # integer constant for fall exponent
+    _FALL_DV = _ACCELERATION * _FALL_TIME  # velocity gained every frame
+    # spent falling
+    _FLAP_V = -_ACCELERATION * _JUMP_TIME  # velocity set by a flap
 
-    def __init__(self, canvas, x, y, control_key, control_button):
+    def __init__(self, canvas, x, y):
         """Establish the attributes that are used by the class.
 
         :param canvas: specifies where the object is made.
         :param x: specifies the Birds starting x position in the game.
         :param y: specifies the Birds starting y position in the game.
-        :param control_key: specifies which button/s are used to control
-        the birds movement.
         """
-        self._canvas = canvas
+        self._canvas_move = canvas.move  # bound once as it is used every
+        # frame
         self.player_rectangle = canvas.create_rectangle(x, y,
                                                         x + self._BIRD_HEIGHT,
                                                         y + self._BIRD_WIDTH,
                                                         fill="yellow")
-        self._control_key = control_key  # controls are defined when
-        # making an object
-        self._control_button = control_button
         self._y_velocity = 0  # sets initial speed of 0 to build from
-        self._movement_stack = []  # empty movement stack makes bird fall
+        self._jump_requested = False  # no jump request makes bird fall
+        self._x0 = x  # positions are cached so the canvas does not have to
+        # be asked for them every frame
+        self._y0 = y
+        self._x1 = x + self._BIRD_HEIGHT
+        self._y1 = y + self._BIRD_WIDTH
 
     def move(self):
         """Manage the movement of the bird.
 
-        Uses the state of the movement stack to run either the _fall or the
-        _flap methods. Runs the _fall method if the stack is empty and _flap
-        if the movement stack has "True" in it .
+        Uses the jump request flag to run either the _fall or the _flap
+        methods. Runs _flap if a jump has been requested since the last frame
+        and _fall otherwise, then moves the bird by the resulting velocity.
         """
-        if len(self._movement_stack) == 0:  # checks if user input jump
-            self._fall()  # if no input is in list the object falls.
-        if len(self._movement_stack) == 1:  # checks if user input jump
-            self._flap()  # if input is in the list the object jumps
-        if len(self._movement_stack) > 1:  # checks if stack is too large
-            self._movement_stack.pop()  # pops one of the stack items
+        if self._jump_requested:  # checks if user input jump
+            self._flap()  # if input was entered the object jumps
+            self._jump_requested = False  # clears request so bird falls
+        else:
+            self._fall()  # if no input was entered the object falls
+        y_velocity = self._y_velocity
+        self._canvas_move(self.player_rectangle, 0, y_velocity)  # moves bird
+        self._y0 += y_velocity  # keeps cached position in step
+        self._y1 += y_velocity
 
     def _fall(self):
-        """Move the bird downwards in an increasing amount.
+        """Speed the bird up downwards by an increasing amount.
 
-        A method which is ran as long as the stack is empty. Calculates the
-        birds increasing velocity by adding the acceleration constant
-        multiplied by the constant fall time and moves it by that amount.
+        A method which is ran as long as no jump is requested. Calculates the
+        birds increasing velocity by adding the precomputed acceleration
+        constant multiplied by the constant fall time.
         """
-        self._y_velocity += self._ACCELERATION * self._FALL_TIME  # sets
-        # velocity
-        self._canvas.move(self.player_rectangle, 0,
-                          self._y_velocity)  # moves bird
+        self._y_velocity += self._FALL_DV  # sets velocity
 
     def _flap(self):
-        """Move the bird upwards with a natural increase.
+        """Set the birds velocity upwards.
 
-        Calculates new velocity by using the negative of the acceleration
-        constant and moves bird upwards by that amount.
-        Removes the variable from the movement_stack in order to make the bird
-        fall again.
+        Sets the velocity to the precomputed negative of the acceleration
+        constant multiplied by the jump time.
         """
-        self._y_velocity = -self._ACCELERATION * self._JUMP_TIME  # sets
-        # velocity
-        self._canvas.move(self.player_rectangle, 0,
-                          self._y_velocity)  # moves object
-        self._movement_stack.remove("True")  # removes true so bird falls
-
-    def event_entered(self, event):
-        """Check event and makes bird flap.
+        self._y_velocity = self._FLAP_V  # sets velocity
 
-        Appends true to the movement stack if the entered event is equal to
-        the player control key or button. This makes the bird flap.
+    def event_entered(self):
+        """Make the bird flap on the next frame.
 
-        :param event: contains information on what key was pressed
+        Sets the jump request flag. The game only binds its control key and
+        button to this, so there is no event to check. Several
+        presses between frames still only make the bird flap once.
         """
-        if event.keysym == self._control_key or event.num == \
-                self._control_button:  # checks if the event key code or
-            # button number are in the player controls
-            self._movement_stack.append("True")  # appends true to trigger jump
+        self._jump_requested = True  # requests a jump on the next frame
 
     def get_coordinates(self):
         """Return player position.
 
-        Gets the player coordinates and stores them in a variable. Returns
-        variable.
+        Builds the player coordinates from the cached position rather than
+        querying the canvas. Returns them as a tuple.
 
         :return: player_position.
         """
-        player_position = self._canvas.coords(
-            self.player_rectangle)  # sets new bird coordinates
+        player_position = (self._x0, self._y0, self._x1,
+                           self._y1)  # sets new bird coordinates
         return player_position
 
 
@@ -167,15 +173,20 @@ class Obstacle:
         top obstacle tk rectangle object
     _bottom_rectangle : tk
         bottom obstacle tk rectangle object
-    top_obstacle_position : tuple
-        tuple which contains the coordinates for all object sides
-    bottom_obstacle_position : tuple
-        tuple which contains the coordinates for all object sides
+    left_x : int
+        cached left x of both pipes
+    right_x : int
+        cached right x of both pipes
+    top_bottom_y : int
+        bottom y of the top pipe
+    bottom_top_y : int
+        top y of the bottom pipe
     halfway : boolean
         boolean represents whether or not object is halfway on the canvas
     off_screen : boolean
         boolean which represents whether or not object is off the canvas
-
+    _prev_left_x : int
+        left x of both pipes before the most recent move
 
     Methods
     ----------
@@ -186,9 +197,9 @@ class Obstacle:
         :param x: specifies the obstacles starting x position in the game.
         :param y: specifies the obstacles starting y position in the game.
 
-    move_obstacles(self):
-        Move obstacles to the left, update positions and check position of
-        the objects.
+    move_obstacle(self):
+        Update positions after the obstacles have been moved to the left and
+        check position of the objects.
 
     _check_obstacle_positions(self):
         Check positions of the objects and change halfway and off_screen
@@ -196,14 +207,29 @@ class Obstacle:
 
         :return: If the location is off screen or halfway return True,
         otherwise return False.
+
+    reset(self, x, y):
+        Reposition the existing objects so the obstacle can be reused.
+
+        :param x: specifies the obstacles new x position in the game.
+        :param y: specifies the obstacles new y position in the game.
+
+    crossed(self, x):
+        Check if the right side of the obstacles moved past x this frame.
+
+        :param x: the x position to check against.
+        :return: True if the obstacles crossed x, otherwise False.
     """
 
+    __slots__ = ("_canvas", "_top_rectangle", "_bottom_rectangle", "left_x",
+                 "right_x", "top_bottom_y", "bottom_top_y", "halfway",
+                 "off_screen", "_prev_left_x")
+
     _OBSTACLE_WIDTH = 70  # integer constant for width of pipes
     _OBSTACLE_GAP = 150  # integer constant for gap between top and bottom pipe
-    _MOVEMENT_SPEED = -2  # integer constant movement speed for the x axis
-
-    _LEFT_X = 0  # index for obstacle position on the left x axis
-    RIGHT_X = 2  # index for obstacles position on the right x axis
+    MOVEMENT_SPEED = -2  # integer constant movement speed for the x axis
+    TAG = "pipes"  # tk tag shared by every obstacle rectangle so they can
+    # all be moved with one canvas call
 
     _SCREEN_WIDTH = 360  # integer constant for screen width
     _SCREEN_HEIGHT = 640  # integer constant for screen height
@@ -221,65 +247,98 @@ class Obstacle:
                                                       x +
                                                       self._OBSTACLE_WIDTH,
                                                       y - self._SCREEN_HEIGHT,
-                                                      fill="green3")
+                                                      fill="green3",
+                                                      tags=self.TAG)
         self._bottom_rectangle = canvas.create_rectangle(x, y,
                                                          x +
                                                          self._OBSTACLE_WIDTH,
                                                          y +
                                                          self._SCREEN_HEIGHT,
-                                                         fill="green3")
-        self.top_obstacle_position = canvas.coords(self._top_rectangle)
-        # coordinates for the top pipe
-        self.bottom_obstacle_position = canvas.coords(
-            self._bottom_rectangle)  # coordinates for the bottom pipe
+                                                         fill="green3",
+                                                         tags=self.TAG)
+        canvas.tag_lower(self.TAG)  # keeps pipes below the bird and score
+        self.left_x = x  # positions are cached so the canvas does not have
+        # to be asked for them every frame
+        self.right_x = x + self._OBSTACLE_WIDTH
+        self.top_bottom_y = y - self._OBSTACLE_GAP  # only the edges of the
+        # gap between the pipes are needed for collisions
+        self.bottom_top_y = y
         self.halfway = False  # boolean for if the object is halfway
         self.off_screen = False  # boolean for if the object is off screen
+        self._prev_left_x = x  # position before the most recent move
 
     def move_obstacle(self):
-        """Move obstacles to the left, update positions and check locations.
+        """Update positions after the obstacles moved and check locations.
 
-        Moves each of the two objects/rectangles at a constant rate towards
-        the left. Updates positions of each object and then checks the
-        locations.
+        The objects/rectangles of every obstacle are moved on the canvas at
+        once by the game using the shared TAG, so this only updates the
+        cached positions of each object by the movement speed and then
+        checks the locations.
         """
-        self._canvas.move(self._top_rectangle, self._MOVEMENT_SPEED,
-                          0)  # moves the top object by the movement speed
-        self._canvas.move(self._bottom_rectangle, self._MOVEMENT_SPEED,
-                          0)  # moves the bottom object by the movement speed
-        self.top_obstacle_position = self._canvas.coords(
-            self._top_rectangle)  # updates position of the top obstacle
-        self.bottom_obstacle_position = self._canvas.coords(
-            self._bottom_rectangle)  # updates position of the bottom obstacle
+        self._prev_left_x = self.left_x  # remembers position before moving
+        self.left_x += self.MOVEMENT_SPEED  # updates cached x positions
+        self.right_x += self.MOVEMENT_SPEED
         self._check_obstacle_positions()
 
     def _check_obstacle_positions(self):
         """Check positions of the objects.
 
-        Checks locations of the bottom object (which doesnt matter as both
-        move at the same speed and will always be in the same x position.
-        Changes appropriate variables if the object is in a determined
-        location. This includes whether the object is halfway or off screen.
+        Checks the cached x positions shared by both objects. Changes
+        appropriate variables if the object is in a determined location.
+        This includes whether the object is halfway or off screen. Halfway
+        is only True on the frame the left side crosses the middle of the
+        screen, so it does not depend on landing exactly on it.
 
         :return: If the location is off screen or halfway return True,
         otherwise return False.
         """
-        if self.bottom_obstacle_position[Obstacle.RIGHT_X] <= 0:  # checks
-            # if the coordinates of the right side of one of the objects is
+        if self.right_x <= 0:  # checks if the right side of the objects is
             # less than zero/off screen
             self.off_screen = True
-        if self.bottom_obstacle_position[Obstacle._LEFT_X] == \
-                self._SCREEN_WIDTH / 2:  # checks if the coordinates of the
-            # left side of one of the objects is equal to half the screen
-            # width/halfway
-            self.halfway = True
-        else:  # the object is neither off screen or halfway
-            self.halfway = False
+        self.halfway = self._prev_left_x > self._SCREEN_WIDTH / 2 >= \
+            self.left_x  # checks if the left side of the objects crossed half
+        # the screen width/halfway during the last move
+
+    def crossed(self, x):
+        """Check if the right side of the obstacles moved past x this frame.
+
+        Compares the right side before and after the most recent move so the
+        check is True on exactly one frame for each obstacle.
+
+        :param x: the x position to check against.
+        :return: True if the obstacles crossed x, otherwise False.
+        """
+        return self._prev_left_x + self._OBSTACLE_WIDTH > x >= self.right_x
+
+    def reset(self, x, y):
+        """Reposition the existing objects so the obstacle can be reused.
+
+        Moves both rectangles to the new position with canvas.coords instead
+        of creating new canvas items and resets the cached positions and the
+        halfway and off_screen variables.
+
+        :param x: specifies the obstacles new x position in the game.
+        :param y: specifies the obstacles new y position in the game.
+        """
+        self.left_x = x  # resets cached positions
+        self.right_x = x + self._OBSTACLE_WIDTH
+        self.top_bottom_y = y - self._OBSTACLE_GAP
+        self.bottom_top_y = y
+        self._canvas.coords(self._top_rectangle, x, y - self._SCREEN_HEIGHT,
+                            self.right_x, self.top_bottom_y)  # moves top
+        # object
+        self._canvas.coords(self._bottom_rectangle, x, y, self.right_x,
+                            y + self._SCREEN_HEIGHT)  # moves bottom object
+        self.halfway = False
+        self.off_screen = False
+        self._prev_left_x = x
 
 
 class Scoreboard:
     """Create a visual score board.
 
-    Makes a text widget which is configured to reflect the score.
+    Makes a text item on the canvas which is configured to reflect the
+    score.
 
     Attributes
     ----------
@@ -292,7 +351,7 @@ class Scoreboard:
     score : int
         a variable to store the score
     _text : tk
-        text widget to display the score
+        canvas text item to display the score
 
     Methods
     ----------
@@ -307,6 +366,8 @@ class Scoreboard:
         Increase the score.
     """
 
+    __slots__ = ("_canvas", "_x", "_y", "score", "_text")
+
     _FONT_SIZE = 25  # integer constant for font size
 
     _POINT_WORTH = 1  # integer to increase the score by
@@ -322,21 +383,22 @@ class Scoreboard:
         self._x = x
         self._y = y
         self.score = 0  # score is initially set to zero
-        self._text = Label(self._canvas, fg="black", text=self.score,
-                           font=("Arial", self._FONT_SIZE))  # makes text
-        # widget
-        self._text.place(x=self._x, y=self._y)  # places text widget
+        self._text = self._canvas.create_text(self._x, self._y,
+                                              text=self.score, fill="black",
+                                              font=("Arial", self._FONT_SIZE),
+                                              anchor="nw")  # makes text item
+        # on the canvas so it is drawn along with the rest of the game
 
     def increase_score(self):
         """Increase the score.
 
-        Increases score by the point worth and configures score label show the
-        change.
+        Increases score by the point worth and configures score text item to
+        show the change.
         """
         self.score += self._POINT_WORTH  # score is increased by the point
         # worth
-        self._text.config(text=self.score)  # configures the text widget to
-        # show the score
+        self._canvas.itemconfigure(self._text, text=self.score)  # configures
+        # the text item to show the score
 
 
 class Game:
@@ -362,169 +424,421 @@ class Game:
         a variable to store the score
     _window : tk
         the tkinter window
+    _canvas_move : method
+        the canvas move method, bound once for the game loop
+    _canvas_update_idletasks : method
+        the canvas update_idletasks method, bound once for the game loop
+    _window_after : method
+        the window after method, bound once for the game loop
+    alive : bool
+        whether the game is still running or a collision has occurred
+    _next_tick : float
+        perf_counter time at which the next game tick is due
+    _active_index : int
+        index of the first obstacle the player has not yet passed
+    _obstacle_pool : deque
+        off screen obstacles waiting to be reused
+    _random : random.Random
+        random number generator used for the pipe positions
+    _pipe_ys : deque
+        pregenerated y positions for the next pipes
+    _profiler : cProfile.Profile
+        profiler shared with the application, None unless profiling
+    _after_id : str
+        id of the pending run_game callback, None if there is none
+    _bindings : list
+        sequence and function id of each window binding made by the game
 
     Methods
     ----------
-    __init__(self, canvas, x, y):
+    __init__(self, application, seed=None):
         Establishes the attributes that are used by the class.
 
         :param application: instance of the application class.
+        :param seed: seed for the pipe positions, random if None.
 
     _event_entered(self, event)
         Route control event to player class.
 
         :param event: contains the code for the key entered
 
+    stop(self):
+        Cancel the pending game loop callback and remove the bindings.
+
     run_game(self):
         Run the game and related processes/methods.
 
-    _manage_pipes(self):
+    _step(self):
+        Advance the game by a single tick.
+
+    _report_profile(self, steps):
+        Print the slowest calls once every profiling interval.
+
+        :param steps: number of ticks run during this refresh.
+
+    _manage_pipes(self, player_position):
         Move and manage pipes.
 
-    manage_collisions(self):
+        :param player_position: the players coordinates this tick.
+
+    _new_obstacle(self, x):
+        Return an obstacle at x, reusing one from the pool if possible.
+
+        :param x: specifies the obstacles starting x position in the game.
+        :return: obstacle.
+
+    _next_pipe_y(self):
+        Return the y position for the next pipe.
+
+        :return: pipe_y.
+
+    _update_active_obstacle(self, removed, player_position):
+        Skip obstacles the player has already passed.
+
+        :param removed: number of obstacles removed from the front of the
+        list this frame.
+        :param player_position: the players coordinates this tick.
+
+    manage_collisions(self, player_position):
         Manage collisions.
 
-    _manage_score(self):
+        :param player_position: the players coordinates this tick.
+
+    _manage_score(self, player_position):
         Manage and increase score.
+
+        :param player_position: the players coordinates this tick.
     """
 
+    __slots__ = ("_application", "_canvas", "_player", "_obstacles",
+                 "_scoreboard", "score", "_window", "_canvas_move",
+                 "_canvas_update_idletasks", "_window_after", "alive",
+                 "_next_tick", "_active_index", "_obstacle_pool", "_random",
+                 "_pipe_ys", "_profiler", "_after_id", "_bindings")
+
     _DISTANCE_BETWEEN_OBSTACLES = 80  # integer constant for distance between
     # obstacles
+    _CONTROL_KEY = 'space'  # string constant for the key that flaps
+    _CONTROL_BUTTON = 1  # integer constant for the mouse button that flaps
+
     _MIN_RANGE_OF_PIPES = 200  # integer constant for minimum pipe y generation
     _MAX_RANGE_OF_PIPES = 600  # integer constant for maximum pipe y generation
+    _PIPE_Y_BUFFER_SIZE = 256  # integer constant for how many pipe y
+    # positions are generated at once
 
     _REFRESH_SPEED = 15  # integer constant for amount of milliseconds to
     # refresh window
+    _TICK = _REFRESH_SPEED / 1000  # float constant for seconds per tick
+    _MAX_CATCH_UP_STEPS = 4  # integer constant for the most ticks run in one
+    # refresh when the window has fallen behind
+
+    _PROFILE_INTERVAL = 10  # integer constant for seconds between profile
+    # reports
+    _PROFILE_LINES = 20  # integer constant for calls shown in each report
 
     _SCREEN_WIDTH = 360  # integer constant for screen height
     _SCREEN_HEIGHT = 640  # integer constant for screen width
 
-    def __init__(self, application):
+    def __init__(self, application, seed=None):
         """Establish the attributes that are used by the class.
 
         :param application: instance of the application class.
+        :param seed: seed for the pipe positions, random if None.
         """
         self._application = application  # instance of application class
         self._canvas = application.game_canvas
-        self._player = Player(self._canvas, 40, 300, 'space', 1)
+        self._player = Player(self._canvas, 40, 300)
         self._obstacles = []  # list to contain active obstacles
         self._scoreboard = Scoreboard(self._canvas, 0, 0)
         self.score = 0  # variable to store the score
         self._window = application.window  # gives class access to window
         # functions
-        self._window.bind('<Key>', self._event_entered)  # binds all keys
-        # to the _event_entered function
-        self._window.bind('<Button>', self._event_entered)  # binds all
-        # mouse buttons to the _event_entered function
+        self._canvas_move = self._canvas.move  # canvas and window methods
+        # used every frame are bound once
+        self._canvas_update_idletasks = self._canvas.update_idletasks
+        self._window_after = self._window.after
+        self.alive = True  # set to False once a collision occurs
+        self._next_tick = None  # set when the game loop first runs
+        self._active_index = 0  # only this obstacle is checked against the
+        # player
+        self._obstacle_pool = deque()  # off screen obstacles are kept here
+        # and reused instead of making new canvas items
+        self._random = random.Random(seed)  # own generator so a seed gives
+        # the same pipes every game
+        self._pipe_ys = deque()  # filled when the first pipe is made
+        self._profiler = application.profiler  # only set when the game is
+        # run with --profile
+        self._after_id = None  # set whenever run_game is scheduled
+        self._bindings = []  # kept so they can be removed by stop()
+        for sequence in ('<KeyPress-' + self._CONTROL_KEY + '>',
+                         '<Button-' + str(self._CONTROL_BUTTON) + '>'):
+            # binds only the control key and mouse button to the
+            # _event_entered function so other input never reaches python
+            self._bindings.append(
+                (sequence, self._window.bind(sequence, self._event_entered)))
 
     def _event_entered(self, event):
         """Route control event to player class.
 
-        Runs the event_entered method of the bird class and passes in the
-        event code.
+        Runs the event_entered method of the player class. Only the control
+        key and button are bound, so every event makes the bird flap.
 
         :param event: contains the code for the key entered
         """
-        self._player.event_entered(event)  # runs the players event_entered
-        # function and passes in the event
+        self._player.event_entered()  # runs the players event_entered
+        # function
+
+    def stop(self):
+        """Cancel the pending game loop callback and remove the bindings.
+
+        Makes sure an old game can not keep running or receive input once
+        the application has replaced it with a new one.
+        """
+        if self._after_id is not None:  # cancels the scheduled run_game
+            self._window.after_cancel(self._after_id)
+            self._after_id = None
+        for sequence, function_id in self._bindings:  # removes the control
+            # bindings
+            self._window.unbind(sequence, function_id)
+        self._bindings = []
 
     def run_game(self):
         """Run the game and related processes/methods.
 
-        Manages and moves objects in the game. This includes managing the
-        birds movement, the pipes movement and generation, collisions,
-        score and checks if the game has been lost. Refreshes/runs every
-        REFRESH_SPEED milliseconds.
+        Runs a game tick for every REFRESH_SPEED milliseconds that have
+        passed on the monotonic clock, so late callbacks from tkinter catch
+        up instead of slowing the game down. At most MAX_CATCH_UP_STEPS ticks
+        are run per call, after which the missed time is dropped. Redraws
+        the canvas once with update_idletasks after all ticks have run;
+        update() must not be used here as it re-enters the event loop. Checks
+        if the game has been lost and reschedules itself until it has. When
+        profiling, everything run here is recorded by the profiler.
         """
-        self._player.move()  # runs the players move() method
-        self._manage_pipes()  # runs the _manage_pipes() method
-        self.manage_collisions()  # runs the manage_collisions() method
-        self._manage_score()  # runs the _manage_score() method
+        profiler = self._profiler
+        if profiler is not None:  # records this refresh when profiling
+            profiler.enable()
+        self._after_id = None  # this callback is no longer pending
+        now = time.perf_counter()  # current monotonic time in seconds
+        if self._next_tick is None:  # first call starts the clock
+            self._next_tick = now
+        step = self._step  # locals here and in the per tick methods avoid
+        # repeated attribute lookups
+        steps = 0  # number of ticks run during this call
+        while now >= self._next_tick and self.alive:  # runs every tick
+            # that is due
+            step()
+            self._next_tick += self._TICK
+            steps += 1
+            if steps == self._MAX_CATCH_UP_STEPS:  # stops the game from
+                # spiralling when it cannot keep up
+                self._next_tick = max(self._next_tick, now)
+                break
+        self._canvas_update_idletasks()  # redraws every change made this
+        # refresh in one go
         self._application.check_restart()  # runs the applications
         # check_restart() method
-        self._window.after(self._REFRESH_SPEED, self.run_game)  # runs the
-        # run_game() method every REFRESH_SPEED milliseconds
+        if self.alive:  # stops the loop once the game has been lost
+            delay = max(1, math.ceil(
+                (self._next_tick - time.perf_counter()) * 1000))  # time
+            # until the next tick is due in milliseconds, rounded up so the
+            # callback never wakes before the tick it was scheduled for
+            self._after_id = self._window_after(delay, self.run_game)  #
+            # runs the run_game() method again when the next tick is due
+        if profiler is not None:
+            profiler.disable()
+            self._report_profile(steps)
+
+    def _report_profile(self, steps):
+        """Print the slowest calls once every profiling interval.
+
+        Adds the play time of the ticks just run to the applications profile
+        time, which is kept across restarts along with the profiler. Once
+        PROFILE_INTERVAL seconds of play have been recorded, possibly over
+        several games, prints the PROFILE_LINES calls with the highest
+        cumulative time in that play and starts a new interval. Time spent
+        in the menu is not counted. The game loop is bound by calls into
+        Tcl, so canvas methods such as move and coords are expected at the
+        top.
+
+        :param steps: number of ticks run during this refresh.
+        """
+        application = self._application
+        application.profile_time += steps * self._TICK  # play time recorded
+        if application.profile_time >= self._PROFILE_INTERVAL:
+            pstats.Stats(self._profiler).sort_stats("cumulative").print_stats(
+                self._PROFILE_LINES)  # prints the report
+            self._profiler.clear()  # starts a new interval
+            application.profile_time = 0
+
+    def _step(self):
+        """Advance the game by a single tick.
 
-    def _manage_pipes(self):
+        Manages and moves objects in the game. This includes managing the
+        birds movement, the pipes movement and generation, collisions and
+        score. The bird is moved first so that a jump entered while waiting
+        for this tick is acted on in this tick rather than the next one. The
+        players coordinates are then fetched once and shared by the other
+        methods.
+        """
+        player = self._player
+        player.move()  # runs the players move() method before anything else
+        # so pending input is consumed straight away
+        player_position = player.get_coordinates()  # fetched once per tick
+        self._manage_pipes(player_position)  # runs the _manage_pipes()
+        # method
+        if self.manage_collisions(player_position):  # runs the
+            # manage_collisions() method
+            self.alive = False  # a collision ends the game
+        self._manage_score(player_position)  # runs the _manage_score()
+        # method
+
+    def _manage_pipes(self, player_position):
         """Move and manage pipes.
 
-        Runs the move_obstacle method for all obstacles in the obstacles
-        list. Creates a new pipe object when the one in front reaches
-        halfway. Removes pipes when the pipe leave the game boundaries.
+        Moves every pipe on the canvas with one call using the shared
+        obstacle tag and runs the move_obstacle method for all obstacles in
+        the obstacles list. Creates a new pipe when the one in front reaches
+        halfway. Removes pipes when the pipe leave the game boundaries and
+        keeps them in the obstacle pool for reuse. Moving, generating and
+        removing are separate passes so the list is never changed while it
+        is being looped over.
+
+        :param player_position: the players coordinates this tick.
         """
-        for obstacle in self._obstacles:  # runs the move_obstacle command
+        obstacles = self._obstacles
+        self._canvas_move(Obstacle.TAG, Obstacle.MOVEMENT_SPEED, 0)  # moves
+        # all pipes by the movement speed
+        for obstacle in obstacles:  # runs the move_obstacle command
             # for all obstacles in the _obstacles list
             obstacle.move_obstacle()
-        if len(self._obstacles) == 0:  # if the length of the obstacles list
+        if len(obstacles) == 0:  # if the length of the obstacles list
             # is 0, a obstacle is generated
-            obstacle = Obstacle(self._canvas, self._SCREEN_WIDTH,
-                                random.randrange(self._MIN_RANGE_OF_PIPES,
-                                                 self._MAX_RANGE_OF_PIPES))
-            self._obstacles.append(obstacle)
-        for obstacle in self._obstacles:  # checks the halfway and
-            # off_screen boolean variables for every obstacle in the
-            # _obstacles list and either generates a new one of deletes the
-            # obstacle depending on what returns true
-            if obstacle.halfway:  # checks if halfway
-                new_obstacle = Obstacle(self._canvas, self._SCREEN_WIDTH +
-                                        self._DISTANCE_BETWEEN_OBSTACLES,
-                                        random.randrange(
-                                            self._MIN_RANGE_OF_PIPES,
-                                            self._MAX_RANGE_OF_PIPES))  #
-                # generates new obstacle object
-                self._obstacles.append(new_obstacle)  # adds obstacle to
-                # list of obstacles
-            if obstacle.off_screen:  # checks if obstacle is off_screen
-                self._canvas.delete(obstacle)  # deletes object from the
-                # canvas to stop memory leaks
-                self._obstacles.remove(obstacle)  # removes obstacle from
-                # list of obstacles
-
-    def manage_collisions(self):
+            obstacles.append(self._new_obstacle(self._SCREEN_WIDTH))
+        new_obstacles = [self._new_obstacle(self._SCREEN_WIDTH +
+                                            self._DISTANCE_BETWEEN_OBSTACLES)
+                         for obstacle in obstacles if obstacle.halfway]
+        # generates a new obstacle for every obstacle that is halfway
+        pool = self._obstacle_pool
+        for obstacle in obstacles:  # checks the off_screen boolean variable
+            # for every obstacle in the _obstacles list
+            if obstacle.off_screen:
+                pool.append(obstacle)  # keeps the obstacle for reuse rather
+                # than deleting its canvas items
+        obstacles = [obstacle for obstacle in obstacles
+                     if not obstacle.off_screen]  # removes off screen
+        # obstacles from list of obstacles
+        removed = len(self._obstacles) - len(obstacles)  # number of
+        # obstacles removed from the front of the list
+        obstacles.extend(new_obstacles)  # adds new obstacles to list of
+        # obstacles
+        self._obstacles = obstacles
+        self._update_active_obstacle(removed, player_position)
+
+    def _new_obstacle(self, x):
+        """Return an obstacle at x, reusing one from the pool if possible.
+
+        Takes an off screen obstacle from the obstacle pool and resets it to
+        the new position. Only makes a new Obstacle, with new canvas items,
+        when the pool is empty. The y position is random.
+
+        :param x: specifies the obstacles starting x position in the game.
+        :return: obstacle.
+        """
+        y = self._next_pipe_y()  # random gap position
+        if self._obstacle_pool:  # reuses an off screen obstacle
+            obstacle = self._obstacle_pool.popleft()
+            obstacle.reset(x, y)
+        else:
+            obstacle = Obstacle(self._canvas, x, y)
+        return obstacle
+
+    def _next_pipe_y(self):
+        """Return the y position for the next pipe.
+
+        Takes the next pregenerated y position. When they have all been used
+        a new batch of PIPE_Y_BUFFER_SIZE positions is generated at once.
+
+        :return: pipe_y.
+        """
+        pipe_ys = self._pipe_ys
+        if not pipe_ys:  # generates a new batch when all have been used
+            randrange = self._random.randrange
+            pipe_ys.extend(randrange(self._MIN_RANGE_OF_PIPES,
+                                     self._MAX_RANGE_OF_PIPES)
+                           for _ in range(self._PIPE_Y_BUFFER_SIZE))
+        pipe_y = pipe_ys.popleft()
+        return pipe_y
+
+    def _update_active_obstacle(self, removed, player_position):
+        """Skip obstacles the player has already passed.
+
+        Shifts the active index back by the number of obstacles removed and
+        then moves it past every obstacle whose right side is left of the
+        player, so collisions and score only ever look at one obstacle.
+
+        :param removed: number of obstacles removed from the front of the
+        list this frame.
+        :param player_position: the players coordinates this tick.
+        """
+        obstacles = self._obstacles
+        last_index = len(obstacles) - 1
+        player_left_x = player_position[Player.LEFT_X]
+        active_index = max(0, self._active_index - removed)
+        while active_index < last_index and \
+                obstacles[active_index].right_x < player_left_x:  # skips
+            # obstacles that are behind the player
+            active_index += 1
+        self._active_index = active_index
+
+    def manage_collisions(self, player_position):
         """Manage collisions.
 
-        Manages collisions of the player and obstacles by accessing the most
-        recent obstacle and looking to see if the player rectangle is
-        overlapping with the bottom and top obstacles. Also manages boundary
-        collisions with the player object by comparing its values to the screen
-        boarders.
+        Manages collisions of the player and obstacles by accessing the
+        active obstacle and looking to see if the player rectangle is
+        overlapping with the bottom and top obstacles, comparing the cached
+        positions directly instead of asking the canvas. Also manages
+        boundary collisions with the player object by comparing its values to
+        the screen boarders.
 
+        :param player_position: the players coordinates this tick.
         :return: True if collision has occurred, False if no collision has
         occurred.
         """
+        left_x, top_y, right_x, bottom_y = player_position  # unpacked once
+        # in LEFT_X, TOP_Y, RIGHT_X, BOTTOM_Y order instead of indexing with
+        # the Player constants for every comparison
         try:  # tries to run the following code and excepts IndexError
-            obstacle = self._obstacles[0]  # stores closest obstacle
-            if self._player.player_rectangle in self._canvas.find_overlapping(
-                    *obstacle.bottom_obstacle_position) or \
-                    self._player.player_rectangle in \
-                    self._canvas.find_overlapping(
-                        *obstacle.top_obstacle_position):  # checks if the
-                # players rectangle's coordinates overlap with that of both
-                # the top and the bottom pipe
+            obstacle = self._obstacles[self._active_index]  # stores closest
+            # obstacle that has not been passed
+            if right_x >= obstacle.left_x and left_x <= obstacle.right_x and \
+                    (top_y <= obstacle.top_bottom_y or
+                     bottom_y >= obstacle.bottom_top_y):  # checks if the
+                # players rectangle's coordinates overlap with that of either
+                # the top or the bottom pipe
                 return True
-            elif self._player.get_coordinates()[Player.BOTTOM_Y] >= \
-                    self._SCREEN_HEIGHT or \
-                    self._player.get_coordinates()[Player.TOP_Y] <= 0:
+            if bottom_y >= self._SCREEN_HEIGHT or top_y <= 0:
                 # checks if the players coordinates are greater than the
                 # screen height or less than zero to check for boundary
                 # collisions
                 return True
+            return False
         except IndexError:  # index error may be raised as this is run
             # before the first pipe is generated
             return False
 
-    def _manage_score(self):
+    def _manage_score(self, player_position):
         """Manage and increase score.
 
-        Manages the game score by accessing the most recent obstacle and
-        looking to see if the player rectangle's right side is equal to the
-        obstacles right position to award a point.
+        Manages the game score by accessing the active obstacle and
+        looking to see if the obstacles right side moved past the player
+        rectangle's right side this frame to award a point.
+
+        :param player_position: the players coordinates this tick.
         """
-        obstacle = self._obstacles[0]  # stores closest obstacle
-        if self._player.get_coordinates()[Player.RIGHT_X] == \
-                obstacle.bottom_obstacle_position[Obstacle.RIGHT_X]:  #
-            # checks if the right side of the bird is at the same location
-            # as the obstacles right side
+        obstacle = self._obstacles[self._active_index]  # stores closest
+        # obstacle that has not been passed
+        if obstacle.crossed(player_position[Player.RIGHT_X]):  # checks if
+            # the obstacles right side moved past the right side of the bird
             self._scoreboard.increase_score()  # runs the increase score
             # method of the scoreboard class
             self.score = self._scoreboard.score  # sets the Game objects
@@ -553,18 +867,26 @@ class Application:
         tkinter button object to run the play code when clicked
     _exit_button : tk
         tkinter button object to exit the window when clicked
+    _score_text : tk
+        tkinter string variable holding the score label text
     _score : tk
         tkinter label object to house text
     game_canvas : tk
         tkinter canvas object
     game_object : class object
         instance of the game class
+    profiler : cProfile.Profile
+        profiler for the game loop, None unless profiling
+    profile_time : float
+        seconds of play recorded by the profiler since its last report
 
     Methods
     ----------
-    __init__(self):
+    __init__(self, profile=False):
         Establishes the attributes that are used by the class.
 
+        :param profile: whether to profile the game loop.
+
     _play_game(self):
         Change frame to game canvas and run game.
 
@@ -588,8 +910,14 @@ class Application:
     to flap upwards.
     Use F10 to pause. \n """
 
-    def __init__(self):
-        """Establish attributes that are used by the class."""
+    def __init__(self, profile=False):
+        """Establish attributes that are used by the class.
+
+        :param profile: whether to profile the game loop.
+        """
+        self.profiler = cProfile.Profile() if profile else None  # kept
+        # here so the report carries on across restarts
+        self.profile_time = 0  # seconds of play since the last report
         self.window = Tk()  # creating the window
         self.window.resizable(False, False)  # makes the window not resizeable
         self.window.title("Flappy Bird")  # titles the window
@@ -626,7 +954,9 @@ class Application:
                                    height=self._BUTTON_HEIGHT)
         self._exit_button.pack()
         # score label widget
-        self._score = Label(self._menu_frame, text="",
+        self._score_text = StringVar(self.window)  # the label follows this
+        # variable so it does not have to be reconfigured
+        self._score = Label(self._menu_frame, textvariable=self._score_text,
                             font=("arial", self._GENERAL_FONT_SIZE),
                             justify="center")
         self._score.pack()
@@ -651,20 +981,21 @@ class Application:
     def check_restart(self):
         """Unpack and replaces game frame and class and pack menu.
 
-        Runs the manage_collisions method and if that returns True the game
-        will be unpacked and the menu frame packed. The score widget will be
-        configured to reflect the score and new game canvas and object are
-        made using the same variables ensuring the old game is completely
-        unloaded.
+        Checks whether the game object is still alive and if not the game
+        canvas will be destroyed and the menu frame packed. The score widget
+        will be configured to reflect the score and new game canvas and
+        object are made using the same variables ensuring the old game is
+        completely unloaded. The old game is stopped first so its loop and
+        bindings can not run alongside the new game.
         """
-        if self.game_object.manage_collisions():  # if the manage_collisions
-            # method returns True indicating a collision the code is run
-            self.game_canvas.pack_forget()  # unpacks the game
-            self.game_canvas.delete()  # deleted instance of the canvas to
-            # stop memory leaks
+        if not self.game_object.alive:  # if the game object is no longer
+            # alive indicating a collision the code is run
+            self.game_object.stop()  # stops the old game loop and input
+            self.game_canvas.destroy()  # unpacks the game and destroys the
+            # canvas along with all of its items to stop memory leaks
             self._menu_frame.pack()  # packs the menu frame
-            self._score.config(text="Score: " + str(self.game_object.score))
-            # configures the score label widget to the game_object score
+            self._score_text.set("Score: " + str(self.game_object.score))
+            # sets the score label text to the game_object score
             self.game_canvas = Canvas(self.window, width=self._SCREEN_WIDTH,
                                       height=self._SCREEN_HEIGHT,
                                       background="skyblue")  # creates a new
@@ -673,5 +1004,6 @@ class Application:
 
 
 if __name__ == "__main__":
-    FlappyBird = Application()  # creates instance of the application class
+    FlappyBird = Application("--profile" in sys.argv)  # creates instance
+    # of the application class, profiling the game loop if asked to
     FlappyBird.window.mainloop()  # runs the tkinter mainloop to start GUI